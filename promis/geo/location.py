@@ -386,6 +386,29 @@ class CartesianLocation(Location):
             else None,
         )
 
+    @staticmethod
+    def to_polar_arrays(
+        east: ndarray, north: ndarray, origin: PolarLocation
+    ) -> tuple[ndarray, ndarray]:
+        """Computes the polar representation of many points given as arrays of coordinates.
+
+        This is equivalent to calling :meth:`~to_polar` on each point, but back-projects all
+        points with a single call to the origin's projection.
+
+        Args:
+            east: The eastings of the points in meters
+            north: The northings of the points in meters, of the same dimension as ``east``
+            origin: The global reference to be used for back-projection
+
+        Returns:
+            The normalized latitudes and longitudes of the points in degrees
+        """
+
+        # Convert to polar coordinates
+        longitude, latitude = origin.projection(east, north, inverse=True)
+
+        return normalize_latitude(latitude), normalize_longitude(longitude)
+
     def distance(self, other: Any) -> float:
         return cast(float, self.geometry.distance(other.geometry))
 
@@ -9,21 +9,32 @@
 #
 
 # Standard Library
-from io import BytesIO
-from itertools import product
+from collections import OrderedDict
+from collections.abc import Iterable
+from math import ceil, floor
+from multiprocessing.pool import ThreadPool
+from os import cpu_count
+from threading import Lock
 
 # Third Party
-import matplotlib.pyplot as plt
-from matplotlib.transforms import Bbox
-from numpy import array, ndarray, sum, uint8, vstack, zeros
+from numpy import arange, column_stack, meshgrid, ndarray, uint8, zeros
 from PIL import Image
-from sklearn.preprocessing import MinMaxScaler
+from shapely import contains_xy
 
 # ProMis
 from promis.geo.location_type import LocationType
 from promis.geo.map import CartesianLocation, CartesianMap, PolarLocation, PolarMap
 from promis.geo.polygon import CartesianPolygon
-from promis.models import GaussianMixture
+from promis.models import Gaussian, GaussianMixture
+
+#: The size in bytes of the file buffer used when saving raster-bands as CSV
+CSV_BUFFER_SIZE = 1 << 20
+
+#: The number of rows that are formatted and written at once when saving raster-bands as CSV
+CSV_CHUNK_SIZE = 1 << 16
+
+#: The number of rasterized Gaussian mixtures that are kept for reuse
+GAUSSIAN_MIXTURE_CACHE_SIZE = 8
 
 
 class RasterBand:
@@ -37,8 +48,33 @@ class RasterBand:
         height: The height the raster band stretches over in meters
     """
 
+    #: Previously rasterized Gaussian mixtures from least to most recently used
+    _gaussian_mixture_cache: "OrderedDict[tuple, RasterBand]" = OrderedDict()
+
+    #: Guards the cache of rasterized Gaussian mixtures against concurrent access
+    _gaussian_mixture_cache_lock = Lock()
+
     def __init__(self, data: ndarray, origin: PolarLocation, width: float, height: float):
         # Attributes setup
+        self._setup(data, origin, width, height)
+
+        # Precomputes locations of all pixels as arrays of eastings and northings
+        self.east, self.north = meshgrid(
+            (self.pixel_width / 2) + arange(data.shape[0]) * self.pixel_width - self.center_x,
+            -((self.pixel_height / 2) + arange(data.shape[1]) * self.pixel_height) + self.center_y,
+            indexing="ij",
+        )
+
+    def _setup(self, data: ndarray, origin: PolarLocation, width: float, height: float):
+        """Sets up the attributes describing the extent and resolution of this raster-band.
+
+        Args:
+            data: The raster band data
+            origin: The polar coordinates of this raster-band's center
+            width: The width the raster band stretches over in meters
+            height: The height the raster band stretches over in meters
+        """
+
         self.data = data
         self.origin = origin
         self.width = width
@@ -52,15 +88,46 @@ class RasterBand:
         self.center_x = self.width / 2
         self.center_y = self.height / 2
 
-        # Precomputes locations of all pixels in Cartesian and polar space
-        self.cartesian_locations = {
-            index: self.index_to_cartesian(index)
-            for index in product(range(data.shape[0]), range(data.shape[1]))
-        }
-        self.polar_locations = {
-            index: self.index_to_polar(index)
-            for index in product(range(data.shape[0]), range(data.shape[1]))
-        }
+        # Polar locations of all pixels are only back-projected once they are needed
+        self._latitude: ndarray | None = None
+        self._longitude: ndarray | None = None
+
+    @classmethod
+    def _from_slices(
+        cls,
+        data: ndarray,
+        origin: PolarLocation,
+        width: float,
+        height: float,
+        east: ndarray,
+        north: ndarray,
+        latitude: ndarray | None = None,
+        longitude: ndarray | None = None,
+    ) -> "RasterBand":
+        """Create a raster-band from already known pixel locations, e.g., slices of another one.
+
+        Args:
+            data: The raster band data
+            origin: The polar coordinates of this raster-band's center
+            width: The width the raster band stretches over in meters
+            height: The height the raster band stretches over in meters
+            east: The easting of each pixel in meters relative to the origin
+            north: The northing of each pixel in meters relative to the origin
+            latitude: The latitude of each pixel in degrees, computed on first access if not given
+            longitude: The longitude of each pixel in degrees, computed on first access if not given
+
+        Returns:
+            The raster-band using the given arrays without recomputing any pixel locations
+        """
+
+        raster_band = cls.__new__(cls)
+        raster_band._setup(data, origin, width, height)
+
+        raster_band.east, raster_band.north = east, north
+        if latitude is not None and longitude is not None:
+            raster_band._latitude, raster_band._longitude = latitude, longitude
+
+        return raster_band
 
     @classmethod
     def from_map(
@@ -68,6 +135,32 @@ class RasterBand:
     ) -> "RasterBand":
         """Takes a PolarMap or CartesianMap to initialize the raster band data.
 
+        Each pixel is set to one if its center lies within a feature of the given type and to
+        zero otherwise.
+
+        Examples:
+            Consider a map containing a single lake with an island in it:
+
+            >>> from promis.geo import CartesianMap, CartesianPolygon
+            >>> exterior = [CartesianLocation(-40.0, -5.0), CartesianLocation(3.0, -28.0),
+            ...  CartesianLocation(42.0, 11.0), CartesianLocation(-12.0, 33.0)]
+            >>> island = [CartesianLocation(-5.0, -3.0), CartesianLocation(8.0, 2.0),
+            ...  CartesianLocation(0.0, 12.0), CartesianLocation(-5.0, -3.0)]
+            >>> lake = CartesianPolygon(exterior, [island], location_type=LocationType.WATER)
+            >>> origin = PolarLocation(latitude=49.873163174, longitude=8.653830718)
+            >>> map_ = CartesianMap(origin, 100.0, 80.0, [lake])
+
+            The raster-band covers exactly the pixels with their centers on the water:
+
+            >>> from numpy import ndindex
+            >>> raster_band = RasterBand.from_map(map_, LocationType.WATER, (50, 40))
+            >>> all(
+            ...     raster_band.data[index]
+            ...     == lake.geometry.contains(raster_band.index_to_cartesian(index).geometry)
+            ...     for index in ndindex(raster_band.data.shape)
+            ... )
+            True
+
         Args:
             map_: The map to read from
             location_type: The location type to create a raster-band from
@@ -80,65 +173,127 @@ class RasterBand:
         # Attributes setup
         map_ = map_ if isinstance(map_, CartesianMap) else map_.to_cartesian()
 
-        # Create and prepare figure for plotting
-        figure, axis = plt.subplots(figsize=(map_.width, map_.height), dpi=1)
-        axis.set_aspect("equal")
-        axis.set_axis_off()
-        axis.set_xlim([-map_.width, map_.width])
-        axis.set_ylim([-map_.height, map_.height])
+        # Start with an empty raster-band covering the map
+        raster_band = cls(zeros(resolution, dtype="float32"), map_.origin, map_.width, map_.height)
 
-        # Plot all features with this type
+        # Set all pixels with their center within a feature of this type
+        # Only the pixels within the bounding box of each feature need to be tested
         # TODO: Only considers polygons right now
         for feature in map_.features:
             if isinstance(feature, CartesianPolygon) and feature.location_type == location_type:
-                feature.plot(axis, facecolor="black")
+                window = raster_band._window(feature.geometry.bounds)
+                covered = contains_xy(
+                    feature.geometry, raster_band.east[window], raster_band.north[window]
+                )
+                raster_band.data[window][covered] = 1.0
 
-        # Create a bounding box with the actual map data
-        figure.canvas.draw()
-        bounding_box = Bbox(
-            [[-map_.width / 2, -map_.height / 2], [map_.width / 2, map_.height / 2]]
-        )
-        bounding_box = bounding_box.transformed(axis.transData).transformed(
-            figure.dpi_scale_trans.inverted()
-        )
+        return raster_band
 
-        # Get image from figure and check if it is empty
-        raster_band_image = cls._figure_to_image(figure, bounding_box)
+    @classmethod
+    def from_gaussian_mixture(
+        cls,
+        gaussian_mixture: GaussianMixture,
+        origin: PolarLocation,
+        width: float,
+        height: float,
+        resolution: tuple[int, int],
+        n_jobs: int | None = None,
+    ) -> "RasterBand":
+        """Compute probabilities from a Gaussian Mixture Model over a Cartesian region.
 
-        # Clean up
-        plt.close(figure)
+        Identical mixtures over the same region are only rasterized once, regardless of the number
+        of threads used.
+        Each raster-band obtained this way holds its own data, but shares its Cartesian and polar
+        pixel locations with the cached one, which are thus read-only.
+
+        Examples:
+            >>> from numpy import eye, vstack
+            >>> origin = PolarLocation(latitude=49.873163174, longitude=8.653830718)
+            >>> mixture = GaussianMixture([Gaussian(vstack([1.0, 2.0]), eye(2) * 9.0, 1.0)])
+            >>> first = RasterBand.from_gaussian_mixture(mixture, origin, 40.0, 40.0, (20, 20))
+            >>> second = RasterBand.from_gaussian_mixture(
+            ...     mixture, origin, 40.0, 40.0, (20, 20), n_jobs=2
+            ... )
+            >>> first.east is second.east, first.latitude is second.latitude
+            (True, True)
+            >>> first.data is second.data, first.east.flags.writeable
+            (False, False)
+            >>> first.latitude.flags.writeable
+            False
 
-        # If raster-band contains no data, we can set to zeros
-        extrema = raster_band_image.convert("L").getextrema()
-        if extrema[0] == extrema[1]:
-            data = zeros(resolution)
+        Args:
+            gaussian_mixture: The Gaussian Mixture Model
+            origin: The polar coordinates of this raster-band's center
+            width: The width the raster band stretches over in meters
+            height: The height the raster band stretches over in meters
+            resolution: The resolution of the raster-band data
+            n_jobs: The number of threads to evaluate components with, defaults to the CPU count
 
-        # Else we setup the data as numpy array
-        else:
-            # Resize to specified resolution
-            raster_band_image = raster_band_image.resize(resolution)
+        Returns:
+            The raster-band with data obtained from a Gaussian Mixture Model
+        """
 
-            # Convert to numpy and normalize from discrete [0, 255] to continuous [0, 1]
-            # Since we draw existing features in black on a white background, we invert colors
-            # Also drop two of the three sub-bands since all are equal
-            data = array(raster_band_image, dtype="float32")
-            data = data[:, :, 0]
-            data /= 255.0
-            data = 1 - data
-            data = data.transpose()
+        # Identical mixtures over the same region are only rasterized once
+        # The number of threads does not change the result and is thus not part of the key
+        key = (
+            tuple(
+                (
+                    tuple(gaussian.mean.ravel().tolist()),
+                    tuple(map(tuple, gaussian.covariance.tolist())),
+                    gaussian.weight,
+                )
+                for gaussian in gaussian_mixture
+            ),
+            (origin.longitude, origin.latitude),
+            width,
+            height,
+            tuple(resolution),
+        )
 
-        return cls(data, map_.origin, map_.width, map_.height)
+        # The cache is shared by all threads, but only its bookkeeping is done under the lock
+        with cls._gaussian_mixture_cache_lock:
+            raster_band = cls._gaussian_mixture_cache.get(key)
+            if raster_band is not None:
+                cls._gaussian_mixture_cache.move_to_end(key)
+
+        if raster_band is None:
+            raster_band = cls._rasterize_gaussian_mixture(
+                gaussian_mixture, origin, width, height, resolution, n_jobs
+            )
+
+            # The pixel locations are back-projected once and shared with all callers
+            # Thus, they must not be modified
+            for locations in (raster_band.east, raster_band.north, *raster_band._polar_locations()):
+                locations.setflags(write=False)
+
+            with cls._gaussian_mixture_cache_lock:
+                cls._gaussian_mixture_cache[key] = raster_band
+                while len(cls._gaussian_mixture_cache) > GAUSSIAN_MIXTURE_CACHE_SIZE:
+                    cls._gaussian_mixture_cache.popitem(last=False)
+
+        # Copy the data to keep the cached raster-band intact, locations are shared
+        return cls._from_slices(
+            raster_band.data.copy(),
+            origin,
+            width,
+            height,
+            raster_band.east,
+            raster_band.north,
+            raster_band._latitude,
+            raster_band._longitude,
+        )
 
     @classmethod
-    def from_gaussian_mixture(
+    def _rasterize_gaussian_mixture(
         cls,
         gaussian_mixture: GaussianMixture,
         origin: PolarLocation,
         width: float,
         height: float,
         resolution: tuple[int, int],
+        n_jobs: int | None,
     ) -> "RasterBand":
-        """Compute probabilities from a Gaussian Mixture Model over a Cartesian region.
+        """Compute probabilities from a Gaussian Mixture Model without consulting the cache.
 
         Args:
             gaussian_mixture: The Gaussian Mixture Model
@@ -146,123 +301,144 @@ class RasterBand:
             width: The width the raster band stretches over in meters
             height: The height the raster band stretches over in meters
             resolution: The resolution of the raster-band data
+            n_jobs: The number of threads to evaluate components with, defaults to the CPU count
 
         Returns:
-            The raster-band with data obtained from a Gaussian Mixture Model
+            The raster-band with data obtained from the Gaussian Mixture Model
         """
 
         # Start with an empty raster-band
-        raster_band = cls(zeros(resolution), origin, width, height)
+        raster_band = cls(zeros(resolution, dtype="float32"), origin, width, height)
 
-        # Precompute vectors from pixel center to corners
-        top_right_vector = 0.5 * vstack([raster_band.pixel_width, raster_band.pixel_height])
-        top_left_vector = 0.5 * vstack([-raster_band.pixel_width, raster_band.pixel_height])
-        bottom_right_vector = 0.5 * vstack([raster_band.pixel_width, -raster_band.pixel_height])
-        bottom_left_vector = 0.5 * vstack([-raster_band.pixel_width, -raster_band.pixel_height])
+        # Coordinates of all pixel corners, where the north axis descends with the column index
+        east = arange(resolution[0] + 1) * raster_band.pixel_width - raster_band.center_x
+        north = raster_band.center_y - arange(resolution[1] + 1) * raster_band.pixel_height
+
+        def weighted_cdf(gaussian: Gaussian) -> ndarray:
+            cdf = gaussian.cdf_grid(east, north)
+            cdf *= gaussian.weight
+
+            return cdf
 
         # Compute probability as sum of each mixture component
-        # Here, we access the internals of the Gaussians since we can utilize caching this way
-        probabilities = zeros((len(gaussian_mixture), resolution[0], resolution[1]))
-        for i, gaussian in enumerate(gaussian_mixture):
-            # Our cache is a defaultdict that initializes with the CDF of the Gaussian
-            # This simplifies going over all indices and caching all CDFs
-            cdf_raster: dict[tuple(float, float), float] = {}
-
-            for index in product(range(resolution[0]), range(resolution[1])):
-                # Cell coordinates
-                location = raster_band.cartesian_locations[index].to_numpy()
-                top_right = location + top_right_vector
-                top_left = location + top_left_vector
-                bottom_right = location + bottom_right_vector
-                bottom_left = location + bottom_left_vector
-
-                # Since we want to use these as keys, they need to be hashable
-                top_right = tuple(top_right.T[0])
-                top_left = tuple(top_left.T[0])
-                bottom_right = tuple(bottom_right.T[0])
-                bottom_left = tuple(bottom_left.T[0])
-
-                # Compute CDF where needed
-                if top_right not in cdf_raster:
-                    cdf_raster[top_right] = gaussian.cdf(top_right)
-                if top_left not in cdf_raster:
-                    cdf_raster[top_left] = gaussian.cdf(top_left)
-                if bottom_right not in cdf_raster:
-                    cdf_raster[bottom_right] = gaussian.cdf(bottom_right)
-                if bottom_left not in cdf_raster:
-                    cdf_raster[bottom_left] = gaussian.cdf(bottom_left)
-
-                # Since we use the defaultdict, values will be reused from previous indices
-                probabilities[i][index] = gaussian.weight * (
-                    cdf_raster[top_right]
-                    - cdf_raster[top_left]
-                    - cdf_raster[bottom_right]
-                    + cdf_raster[bottom_left]
-                )
+        # Each pixel's probability mass is obtained from the CDF at its four corners
+        # All terms are accumulated in-place and in double precision, since differences of
+        # neighbouring CDF values are prone to cancellation
+        def accumulate(probabilities: ndarray, cdfs: Iterable[ndarray]):
+            for cdf in cdfs:
+                # Top right - top left - bottom right + bottom left
+                probabilities += cdf[1:, :-1]
+                probabilities -= cdf[:-1, :-1]
+                probabilities -= cdf[1:, 1:]
+                probabilities += cdf[:-1, 1:]
+
+        # The CDFs are evaluated in parallel threads, since NumPy and SciPy release the GIL
+        # No more threads than components are started and single components skip the pool
+        probabilities = zeros(resolution)
+        processes = min(n_jobs or cpu_count() or 1, len(gaussian_mixture))
+        if processes > 1:
+            with ThreadPool(processes) as pool:
+                accumulate(probabilities, pool.imap(weighted_cdf, gaussian_mixture))
+        else:
+            accumulate(probabilities, map(weighted_cdf, gaussian_mixture))
 
-        # Set raster band data from sum of all probability rasters and return
-        raster_band.data = sum(probabilities, axis=0)
+        # Store the result in the single precision raster-band data
+        raster_band.data[:] = probabilities
         return raster_band
 
     def split(self) -> "list[list[RasterBand]] | RasterBand":
-        """TODO"""
+        """Splits this raster-band into four quadrants.
+
+        If the number of pixels along an axis is odd, the quadrants to the east and south get
+        the additional column and row respectively.
+        The quadrants share this raster-band's data as views, while their polar locations are
+        back-projected from their own origins once they are needed.
+
+        Examples:
+            The dimensions and locations of each quadrant are derived from its pixels:
+
+            >>> from numpy import allclose
+            >>> origin = PolarLocation(latitude=49.873163174, longitude=8.653830718)
+            >>> raster_band = RasterBand(zeros((13, 11)), origin, 100.0, 80.0)
+            >>> quadrants = raster_band.split()
+            >>> [[quadrant.data.shape for quadrant in column] for column in quadrants]
+            [[(6, 5), (6, 6)], [(7, 5), (7, 6)]]
+            >>> all(
+            ...     allclose(quadrant.east, RasterBand(quadrant.data, origin, quadrant.width,
+            ...         quadrant.height).east)
+            ...     and allclose(quadrant.north, RasterBand(quadrant.data, origin, quadrant.width,
+            ...         quadrant.height).north)
+            ...     and allclose([quadrant.pixel_width, quadrant.pixel_height],
+            ...         [raster_band.pixel_width, raster_band.pixel_height])
+            ...     for column in quadrants for quadrant in column
+            ... )
+            True
+
+        Returns:
+            The quadrants as a list of its western and eastern columns, each holding the northern
+            and southern quadrant, or this raster-band itself if it cannot be split any further
+        """
 
         if self.data.shape[0] == 1 or self.data.shape[1] == 1:
             return self
 
         data_split_x = self.data.shape[0] // 2
         data_split_y = self.data.shape[1] // 2
+        columns = [slice(None, data_split_x), slice(data_split_x, None)]
+        rows = [slice(None, data_split_y), slice(data_split_y, None)]
+
+        # The Cartesian locations are shifted to be relative to each quadrant's center
+        quadrants = []
+        for x in columns:
+            column = []
+            for y in rows:
+                east, north = self.east[x, y], self.north[x, y]
+                center_east = (east[0, 0] + east[-1, 0]) / 2
+                center_north = (north[0, 0] + north[0, -1]) / 2
+
+                column.append(
+                    RasterBand._from_slices(
+                        self.data[x, y],
+                        CartesianLocation(center_east, center_north).to_polar(self.origin),
+                        east.shape[0] * self.pixel_width,
+                        east.shape[1] * self.pixel_height,
+                        east - center_east,
+                        north - center_north,
+                    )
+                )
 
-        if self.width % 2 != 0:
-            left_width = (self.width - self.pixel_width) / 2
-            right_width = (self.width + self.pixel_width) / 2
-            origin_west = -(self.width + self.pixel_width) / 4
-            origin_east = (self.width - self.pixel_width) / 4
-        else:
-            left_width = right_width = self.width / 2
-            origin_east = self.width / 4
-            origin_west = -origin_east
-
-        if self.height % 2 != 0:
-            top_height = (self.height - self.pixel_height) / 2
-            bottom_height = (self.height + self.pixel_height) / 2
-            origin_north = -(self.height - self.pixel_height) / 4
-            origin_south = (self.height + self.pixel_height) / 4
-        else:
-            top_height = bottom_height = self.height / 2
-            origin_south = self.height / 4
-            origin_north = -origin_south
-
-        return [
-            [
-                RasterBand(
-                    self.data[:data_split_x, :data_split_y],
-                    CartesianLocation(origin_west, origin_south).to_polar(self.origin),
-                    left_width,
-                    top_height,
-                ),
-                RasterBand(
-                    self.data[:data_split_x, data_split_y:],
-                    CartesianLocation(origin_west, origin_north).to_polar(self.origin),
-                    left_width,
-                    bottom_height,
-                ),
-            ],
-            [
-                RasterBand(
-                    self.data[data_split_x:, :data_split_y],
-                    CartesianLocation(origin_east, origin_south).to_polar(self.origin),
-                    right_width,
-                    top_height,
-                ),
-                RasterBand(
-                    self.data[data_split_x:, data_split_y:],
-                    CartesianLocation(origin_east, origin_north).to_polar(self.origin),
-                    right_width,
-                    bottom_height,
-                ),
-            ],
-        ]
+            quadrants.append(column)
+
+        return quadrants
+
+    @property
+    def latitude(self) -> ndarray:
+        """The latitude of each pixel in degrees."""
+
+        return self._polar_locations()[0]
+
+    @property
+    def longitude(self) -> ndarray:
+        """The longitude of each pixel in degrees."""
+
+        return self._polar_locations()[1]
+
+    def _polar_locations(self) -> tuple[ndarray, ndarray]:
+        """Back-projects all pixel locations into polar space at once.
+
+        The result is cached, since the back-projection is relatively time consuming and
+        not required for many raster-bands, e.g., intermediate results of computations.
+
+        Returns:
+            The latitude and longitude of each pixel in degrees
+        """
+
+        if self._latitude is None or self._longitude is None:
+            self._latitude, self._longitude = CartesianLocation.to_polar_arrays(
+                self.east, self.north, self.origin
+            )
+
+        return self._latitude, self._longitude
 
     def index_to_cartesian(self, index: tuple[int, int]) -> CartesianLocation:
         """Computes the cartesian location of an index of this raster-band.
@@ -274,13 +450,7 @@ class RasterBand:
             The cartesian location of this index
         """
 
-        # Compute cartesian location relative to origin
-        cartesian_location = CartesianLocation(
-            east=(self.pixel_width / 2) + index[0] * self.pixel_width - self.center_x,
-            north=-((self.pixel_height / 2) + index[1] * self.pixel_height) + self.center_y,
-        )
-
-        return cartesian_location
+        return CartesianLocation(east=self.east[index], north=self.north[index])
 
     def index_to_polar(self, index: tuple[int, int]) -> PolarLocation:
         """Computes the polar location of an index of this raster-band.
@@ -292,10 +462,33 @@ class RasterBand:
             The polar location of this index
         """
 
-        return self.index_to_cartesian(index).to_polar(self.origin)
+        return PolarLocation(
+            longitude=float(self.longitude[index]), latitude=float(self.latitude[index])
+        )
+
+    def to_image(self) -> Image.Image:
+        """Converts the raster-band data to a grayscale image.
+
+        Returns:
+            The image of the raster-band data, linearly scaled from its extrema to [0, 255]
+
+        Examples:
+            >>> from numpy import linspace
+            >>> origin = PolarLocation(latitude=49.873163174, longitude=8.653830718)
+            >>> data = linspace(0.2, 0.6, 35).reshape(7, 5)
+            >>> RasterBand(data, origin, 70.0, 50.0).to_image().getextrema()
+            (0, 255)
+        """
+
+        # Scale globally in double precision, where constant data is mapped to black
+        # Normalizing to [0, 1] before scaling maps the maximum to exactly 255
+        image_data = self.data.astype("float64")
+        minimum, maximum = image_data.min(), image_data.max()
+        image_data -= minimum
+        if maximum > minimum:
+            image_data /= maximum - minimum
+        image_data *= 255.0
 
-    def to_image(self) -> Image:
-        image_data = MinMaxScaler(feature_range=(0, 255)).fit_transform(self.data)
         return Image.fromarray(uint8(image_data.transpose()))
 
     def save_as_image(self, path: str):
@@ -312,51 +505,50 @@ class RasterBand:
 
         Args:
             path: The path with filename to write to
+            time: An optional datetime to add to each row
+            append: Whether to append to an existing file instead of overwriting it
         """
 
+        # Set the csv header and the format of each row
+        # Since the datetime is identical for all rows, it is written as part of the format
+        header = "latitude, longitude, value"
+        row_format = "%s, %s, %.20f"
+        if time is not None:
+            header += ", datetime"
+            row_format += ", " + time.replace("%", "%%")
+        row_format += "\n"
+
+        # For each data point we write the polar location and respective raster-band value
+        rows = column_stack([self.latitude.ravel(), self.longitude.ravel(), self.data.ravel()])
+
         # Create a new file to write to
         mode = "a" if append else "w"
-        with open(path, mode, encoding="utf-8") as csv_file:
-            # Set the csv header
-            header = "latitude, longitude, value"
-            if time is not None:
-                header += ", datetime"
-
+        with open(path, mode, encoding="utf-8", buffering=CSV_BUFFER_SIZE) as csv_file:
             # Write header to file
             if not append:
                 csv_file.write(header + "\n")
 
-            # For each data point we write the polar location and respective raster-band value
-            for x, y in product(range(self.data.shape[0]), range(self.data.shape[1])):
-                # Write value of this indexed polar location
-                polar_location = self.index_to_polar((x, y))
-                csv_file.write(
-                    f"{polar_location.latitude}, {polar_location.longitude}, {self.data[x, y]:.20f}"
-                )
-
-                # Append datetime if available
-                if time is not None:
-                    csv_file.write(f", {time}\n")
+            # Format and write rows in chunks to keep the number of write calls low
+            for start in range(0, len(rows), CSV_CHUNK_SIZE):
+                chunk = rows[start : start + CSV_CHUNK_SIZE].tolist()
+                csv_file.write("".join([row_format % tuple(row) for row in chunk]))
 
-                # Ensure newline
-                csv_file.write("\n")
+    def _window(self, bounds: tuple[float, float, float, float]) -> tuple[slice, slice]:
+        """Computes the index slices of all pixels with their centers within Cartesian bounds.
 
-    @staticmethod
-    def _figure_to_image(figure, bounding_box=None) -> Image.Image:
-        """Convert a Matplotlib figure to a PIL Image.
+        The slices may contain some additional pixels along the borders of the bounds.
 
         Args:
-            figure: The Matplotlib figure
-            bounding_box: The image region to export
+            bounds: The bounds as ``(min_east, min_north, max_east, max_north)`` in meters
 
         Returns:
-            The PIL Image exported from the figure
+            The slices along both dimensions of the raster-band data
         """
 
-        # Save the figure to an in-memory buffer
-        buffer = BytesIO()
-        figure.savefig(buffer, dpi=1, bbox_inches=bounding_box)
-        buffer.seek(0)
+        min_east, min_north, max_east, max_north = bounds
+        x_start = floor((min_east + self.center_x) / self.pixel_width - 0.5)
+        x_stop = ceil((max_east + self.center_x) / self.pixel_width - 0.5) + 1
+        y_start = floor((self.center_y - max_north) / self.pixel_height - 0.5)
+        y_stop = ceil((self.center_y - min_north) / self.pixel_height - 0.5) + 1
 
-        # Open the image from in-memory buffer and return
-        return Image.open(buffer)
+        return slice(max(x_start, 0), max(x_stop, 0)), slice(max(y_start, 0), max(y_stop, 0))
@@ -9,11 +9,10 @@
 #
 
 # Standard Library
-from itertools import product
 from pathlib import Path
 
 # Third Party
-from numpy import array, mean, unravel_index, var, zeros, zeros_like
+from numpy import array, mean, ndindex, var, zeros, zeros_like
 from shapely.strtree import STRtree
 
 # ProMis
@@ -36,7 +35,7 @@ class Distance:
             zeros_like(self.mean.data), self.mean.origin, self.mean.width, self.mean.height
         )
 
-        for x, y in product(range(self.mean.data.shape[0]), range(self.mean.data.shape[1])):
+        for x, y in ndindex(self.mean.data.shape):
             probabilities.data[x, y] = Gaussian(
                 array([[self.mean.data[x, y]]]), array([[self.variance.data[x, y]]])
             ).cdf(array([value]))
@@ -48,7 +47,7 @@ class Distance:
             zeros_like(self.mean.data), self.mean.origin, self.mean.width, self.mean.height
         )
 
-        for x, y in product(range(self.mean.data.shape[0]), range(self.mean.data.shape[1])):
+        for x, y in ndindex(self.mean.data.shape):
             probabilities.data[x, y] = 1 - Gaussian(
                 array([[self.mean.data[x, y]]]), array([[self.variance.data[x, y]]])
             ).cdf(array([value]))
@@ -80,7 +79,7 @@ class Distance:
     def to_distributional_clauses(self) -> str:
         code = ""
         feature_name = self.location_type.name.lower()
-        for x, y in product(range(self.mean.data.shape[0]), range(self.mean.data.shape[1])):
+        for x, y in ndindex(self.mean.data.shape):
             relation = f"distance(row_{x}, column_{y}, {feature_name})"
 
             # TODO: Dirty fix
@@ -136,8 +135,8 @@ class Distance:
         )
 
         # Compute parameters of normal distributions for each location
-        for i, location in enumerate(mean.cartesian_locations.values()):
-            index = unravel_index(i, mean.data.shape)
+        for index in ndindex(mean.data.shape):
+            location = mean.index_to_cartesian(index)
             mean.data[index], variance.data[index] = cls.extract_parameters(location, str_trees)
 
         # Create and return Distance object
@@ -9,12 +9,11 @@
 #
 
 # Standard Library
-from itertools import product
 from pathlib import Path
 from typing import cast
 
 # Third Party
-from numpy import mean, unravel_index, zeros
+from numpy import mean, ndindex, zeros
 from shapely.strtree import STRtree
 
 # ProMis
@@ -41,9 +40,7 @@ class Over:
     def to_distributional_clauses(self) -> str:
         code = ""
         feature_name = self.location_type.name.lower()
-        for x, y in product(
-            range(self.probability.data.shape[0]), range(self.probability.data.shape[1])
-        ):
+        for x, y in ndindex(self.probability.data.shape):
             if self.probability.data[x, y] == 1.0:
                 code += f"over(row_{x}, column_{y}, {feature_name}).\n"
             else:
@@ -111,8 +108,8 @@ class Over:
         )
 
         # Compute parameters of normal distributions for each location
-        for i, location in enumerate(probability.cartesian_locations.values()):
-            index = unravel_index(i, probability.data.shape)
+        for index in ndindex(probability.data.shape):
+            location = probability.index_to_cartesian(index)
             probability.data[index] = cls.compute_probabilities(location, str_trees)
 
         # Create and return Over object
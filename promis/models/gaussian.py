@@ -12,8 +12,27 @@
 from typing import cast
 
 # Third Party
-from numpy import ndarray, vstack
-from scipy.stats import multivariate_normal
+from numpy import (
+    add,
+    arcsin,
+    diag,
+    exp,
+    isclose,
+    meshgrid,
+    ndarray,
+    outer,
+    pi,
+    sin,
+    sqrt,
+    stack,
+    vstack,
+)
+from numpy.polynomial.legendre import leggauss
+from scipy.stats import multivariate_normal, norm
+
+#: Gauss-Legendre nodes and weights for integrating the correlation term of bivariate CDFs,
+#: each paired with the absolute correlation up to which it is accurate (see Genz, 2004)
+BIVARIATE_QUADRATURES = [(0.3, leggauss(6)), (0.75, leggauss(12)), (0.925, leggauss(20))]
 
 
 class Gaussian:
@@ -57,6 +76,30 @@ class Gaussian:
 
         can be generated at once.
 
+        The CDF of a bivariate Gaussian can also be evaluated on a whole grid at once:
+
+        >>> grid = N.cdf_grid(array([-1.0, 0.0, 1.0]), array([0.0, 1.0]))
+        >>> grid.shape
+        (3, 2)
+        >>> float(grid[1, 0])
+        0.25
+
+        This matches evaluating :meth:`~cdf` on each grid point, also for correlated Gaussians:
+
+        >>> from numpy import allclose, linspace, meshgrid, stack
+        >>> x, y = linspace(-3.0, 3.0, 7), linspace(-2.0, 4.0, 5)
+        >>> grid_x, grid_y = meshgrid(x, y, indexing="ij")
+        >>> points = stack([grid_x.ravel(), grid_y.ravel()], axis=1)
+        >>> for correlation in [0.5, -0.8, 0.95]:
+        ...     off_diagonal = correlation * (2.0 * 3.0) ** 0.5
+        ...     covariance = array([[2.0, off_diagonal], [off_diagonal, 3.0]])
+        ...     correlated_N = Gaussian(vstack([0.5, 1.0]), covariance, weight=0.7)
+        ...     expected = correlated_N.cdf(points).reshape(7, 5)
+        ...     print(allclose(correlated_N.cdf_grid(x, y), expected, atol=1e-5))
+        True
+        True
+        True
+
     Args:
         mean: The mean of the distribution as column vector, of dimension ``(n, 1)``
         covariance: The covariance matrix of the distribution, of dimension ``(n, n)``
@@ -123,6 +166,63 @@ class Gaussian:
 
         return self.weight * cast(float, self.distribution.cdf(x))
 
+    def cdf_grid(self, x: ndarray, y: ndarray) -> ndarray:
+        """Compute the CDF of a bivariate Gaussian on all points of a rectilinear grid.
+
+        The CDF is obtained as product of both marginal CDFs plus a correction for their
+        correlation, which is integrated by Gauss-Legendre quadrature as proposed by Drezner and
+        Wesolowsky. Hence, uncorrelated Gaussians only require univariate CDFs along both axes.
+        For strongly correlated Gaussians, where the quadrature is inaccurate, the computation
+        falls back to :meth:`~cdf`.
+
+        Args:
+            x: The grid coordinates along the first dimension, of dimension ``(m,)``
+            y: The grid coordinates along the second dimension, of dimension ``(k,)``
+
+        Returns:
+            The probability of a value being less than each grid point, of dimension ``(m, k)``
+
+        References:
+            - Z. Drezner and G. O. Wesolowsky (1990): On the computation of the bivariate normal
+              integral. Journal of Statistical Computation and Simulation 35, pp. 101-107.
+            - A. Genz (2004): Numerical computation of rectangular bivariate and trivariate normal
+              and t probabilities. Statistics and Computing 14, pp. 251-260.
+        """
+
+        assert self.mean.shape[0] == 2, "Grid evaluation requires a bivariate Gaussian!"
+
+        # Standardize the grid coordinates and compute the correlation coefficient
+        standard_deviation = sqrt(diag(self.covariance))
+        h = (x - self.mean[0, 0]) / standard_deviation[0]
+        k = (y - self.mean[1, 0]) / standard_deviation[1]
+        correlation = self.covariance[0, 1] / (standard_deviation[0] * standard_deviation[1])
+
+        # Choose the smallest quadrature that is accurate for this correlation
+        quadrature = next(
+            (nodes for bound, nodes in BIVARIATE_QUADRATURES if abs(correlation) < bound), None
+        )
+        if quadrature is None:
+            grid_x, grid_y = meshgrid(x, y, indexing="ij")
+            points = stack([grid_x.ravel(), grid_y.ravel()], axis=1)
+            return self.cdf(points).reshape(len(x), len(y))
+
+        # Product of the marginal CDFs, which already is the CDF if both dimensions are uncorrelated
+        cdf = outer(norm.cdf(h), norm.cdf(k))
+        if isclose(correlation, 0.0):
+            return self.weight * cdf
+
+        # Integrate the correction term over [0, arcsin(correlation)]
+        # Both terms are broadcast from the coordinate vectors rather than dense coordinate grids
+        half_squares = add.outer(h**2 / 2, k**2 / 2)
+        products = outer(h, k)
+        upper_bound = arcsin(correlation)
+        for node, weight in zip(*quadrature):
+            sine = sin(upper_bound * (node + 1) / 2)
+            scale = weight * upper_bound / (4 * pi)
+            cdf += scale * exp((sine * products - half_squares) / (1 - sine**2))
+
+        return self.weight * cdf
+
     def __call__(self, value: ndarray) -> float:
         """Evaluate the gaussian at the given location, i.e. obtain the probability density.
 
@@ -50,7 +50,6 @@ setuptools.setup(
         #   -> generic scientific
         "numpy",
         "scipy",
-        "scikit-learn",
         "pandas",
         "matplotlib",
         #   -> geospatial / GIS tools